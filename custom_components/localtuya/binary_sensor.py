@@ -40,6 +40,8 @@ class LocaltuyaBinarySensor(LocalTuyaEntity, BinarySensorEntity):
         """Initialize the Tuya binary sensor."""
         super().__init__(device, config_entry, sensorid, _LOGGER, **kwargs)
         self._is_on = False
+        self._state_on = self._config[CONF_STATE_ON].lower()
+        self._state_off = self._config[CONF_STATE_OFF].lower()
 
     @property
     def is_on(self):
@@ -54,9 +56,9 @@ class LocaltuyaBinarySensor(LocalTuyaEntity, BinarySensorEntity):
     def status_updated(self):
         """Device status was updated."""
         state = str(self.dps(self._dp_id)).lower()
-        if state == self._config[CONF_STATE_ON].lower():
+        if state == self._state_on:
             self._is_on = True
-        elif state == self._config[CONF_STATE_OFF].lower():
+        elif state == self._state_off:
             self._is_on = False
         else:
             self.warning(
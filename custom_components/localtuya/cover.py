@@ -40,22 +40,26 @@ DEFAULT_COMMANDS_SET = COVER_ONOFF_CMDS
 DEFAULT_POSITIONING_MODE = COVER_MODE_NONE
 DEFAULT_SPAN_TIME = 25.0
 
+COMMANDS_SET_VALIDATOR = vol.In(
+    [COVER_ONOFF_CMDS, COVER_OPENCLOSE_CMDS, COVER_FZZZ_CMDS, COVER_12_CMDS]
+)
+POSITIONING_MODE_VALIDATOR = vol.In(
+    [COVER_MODE_NONE, COVER_MODE_POSITION, COVER_MODE_TIMED]
+)
+SPAN_TIME_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=1.0, max=300.0))
+
 
 def flow_schema(dps):
     """Return schema used in config flow."""
     return {
-        vol.Optional(CONF_COMMANDS_SET): vol.In(
-            [COVER_ONOFF_CMDS, COVER_OPENCLOSE_CMDS, COVER_FZZZ_CMDS, COVER_12_CMDS]
-        ),
-        vol.Optional(CONF_POSITIONING_MODE, default=DEFAULT_POSITIONING_MODE): vol.In(
-            [COVER_MODE_NONE, COVER_MODE_POSITION, COVER_MODE_TIMED]
-        ),
+        vol.Optional(CONF_COMMANDS_SET): COMMANDS_SET_VALIDATOR,
+        vol.Optional(
+            CONF_POSITIONING_MODE, default=DEFAULT_POSITIONING_MODE
+        ): POSITIONING_MODE_VALIDATOR,
         vol.Optional(CONF_CURRENT_POSITION_DP): vol.In(dps),
         vol.Optional(CONF_SET_POSITION_DP): vol.In(dps),
         vol.Optional(CONF_POSITION_INVERTED, default=False): bool,
-        vol.Optional(CONF_SPAN_TIME, default=DEFAULT_SPAN_TIME): vol.All(
-            vol.Coerce(float), vol.Range(min=1.0, max=300.0)
-        ),
+        vol.Optional(CONF_SPAN_TIME, default=DEFAULT_SPAN_TIME): SPAN_TIME_VALIDATOR,
     }
 
 
@@ -75,15 +79,15 @@ class LocaltuyaCover(LocalTuyaEntity, CoverEntity):
         self._state = self._stop_cmd
         self._previous_state = self._state
         self._current_cover_position = 0
-        print("Initialized cover [{}]".format(self.name))
+        self._supported_features = SUPPORT_OPEN | SUPPORT_CLOSE | SUPPORT_STOP
+        if self._config[CONF_POSITIONING_MODE] != COVER_MODE_NONE:
+            self._supported_features |= SUPPORT_SET_POSITION
+        self.debug("Initialized cover [%s]", self.name)
 
     @property
     def supported_features(self):
         """Flag supported features."""
-        supported_features = SUPPORT_OPEN | SUPPORT_CLOSE | SUPPORT_STOP
-        if self._config[CONF_POSITIONING_MODE] != COVER_MODE_NONE:
-            supported_features = supported_features | SUPPORT_SET_POSITION
-        return supported_features
+        return self._supported_features
 
     @property
     def current_cover_position(self):
@@ -199,10 +203,11 @@ class LocaltuyaCover(LocalTuyaEntity, CoverEntity):
 
         if self.has_config(CONF_CURRENT_POSITION_DP):
             curr_pos = self.dps_conf(CONF_CURRENT_POSITION_DP)
-            if self._config[CONF_POSITION_INVERTED]:
-                self._current_cover_position = 100 - curr_pos
-            else:
-                self._current_cover_position = curr_pos
+            if curr_pos is not None:
+                if self._config[CONF_POSITION_INVERTED]:
+                    self._current_cover_position = 100 - curr_pos
+                else:
+                    self._current_cover_position = curr_pos
         if (
             self._config[CONF_POSITIONING_MODE] == COVER_MODE_TIMED
             and self._state != self._previous_state
@@ -71,9 +71,18 @@ class LocaltuyaFan(LocalTuyaEntity, FanEntity):
             self._config.get(CONF_FAN_SPEED_MIN),
             self._config.get(CONF_FAN_SPEED_MAX),
         )
+        self._speed_count = int_states_in_range(self._speed_range)
         self._ordered_list = self._config.get(CONF_FAN_ORDERED_LIST).split(",")
         self._ordered_list_mode = None
 
+        self._supported_features = 0
+        if self.has_config(CONF_FAN_OSCILLATING_CONTROL):
+            self._supported_features |= SUPPORT_OSCILLATE
+        if self.has_config(CONF_FAN_SPEED_CONTROL):
+            self._supported_features |= SUPPORT_SET_SPEED
+        if self.has_config(CONF_FAN_DIRECTION):
+            self._supported_features |= SUPPORT_DIRECTION
+
         if isinstance(self._ordered_list, list) and len(self._ordered_list) > 1:
             self._use_ordered_list = True
             _LOGGER.debug(
@@ -114,11 +123,17 @@ class LocaltuyaFan(LocalTuyaEntity, FanEntity):
     ) -> None:
         """Turn on the entity."""
         _LOGGER.debug("Fan async_turn_on")
-        await self._device.set_dp(True, self._dp_id)
-        if percentage is not None:
-            await self.async_set_percentage(percentage)
-        else:
-            self.schedule_update_ha_state()
+        if percentage == 0:
+            return await self.async_turn_off()
+
+        states = {self._dp_id: True}
+        if percentage is not None and self.has_config(CONF_FAN_SPEED_CONTROL):
+            # Send power and speed in one frame instead of two round-trips
+            states[self._config.get(CONF_FAN_SPEED_CONTROL)] = self._speed_value(
+                percentage
+            )
+        await self._device.set_dps(states)
+        self.schedule_update_ha_state()
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off the entity."""
@@ -135,36 +150,23 @@ class LocaltuyaFan(LocalTuyaEntity, FanEntity):
             if percentage == 0:
                 return await self.async_turn_off()
             if not self.is_on:
-                await self.async_turn_on()
-            if self._use_ordered_list:
+                return await self.async_turn_on(percentage=percentage)
+            if self.has_config(CONF_FAN_SPEED_CONTROL):
                 await self._device.set_dp(
-                    str(
-                        percentage_to_ordered_list_item(self._ordered_list, percentage)
-                    ),
+                    self._speed_value(percentage),
                     self._config.get(CONF_FAN_SPEED_CONTROL),
                 )
-                _LOGGER.debug(
-                    "Fan async_set_percentage: %s > %s",
-                    percentage,
-                    percentage_to_ordered_list_item(self._ordered_list, percentage),
-                )
-
-            else:
-                await self._device.set_dp(
-                    str(
-                        math.ceil(
-                            percentage_to_ranged_value(self._speed_range, percentage)
-                        )
-                    ),
-                    self._config.get(CONF_FAN_SPEED_CONTROL),
-                )
-                _LOGGER.debug(
-                    "Fan async_set_percentage: %s > %s",
-                    percentage,
-                    percentage_to_ranged_value(self._speed_range, percentage),
-                )
             self.schedule_update_ha_state()
 
+    def _speed_value(self, percentage):
+        """Return the speed DP value matching a percentage."""
+        if self._use_ordered_list:
+            value = percentage_to_ordered_list_item(self._ordered_list, percentage)
+        else:
+            value = math.ceil(percentage_to_ranged_value(self._speed_range, percentage))
+        _LOGGER.debug("Fan speed value: %s > %s", percentage, value)
+        return str(value)
+
     async def async_oscillate(self, oscillating: bool) -> None:
         """Set oscillation."""
         _LOGGER.debug("Fan async_oscillate: %s", oscillating)
@@ -188,25 +190,12 @@ class LocaltuyaFan(LocalTuyaEntity, FanEntity):
     @property
     def supported_features(self) -> int:
         """Flag supported features."""
-        features = 0
-
-        if self.has_config(CONF_FAN_OSCILLATING_CONTROL):
-            features |= SUPPORT_OSCILLATE
-
-        if self.has_config(CONF_FAN_SPEED_CONTROL):
-            features |= SUPPORT_SET_SPEED
-
-        if self.has_config(CONF_FAN_DIRECTION):
-            features |= SUPPORT_DIRECTION
-
-        return features
+        return self._supported_features
 
     @property
     def speed_count(self) -> int:
         """Speed count for the fan."""
-        speed_count = int_states_in_range(self._speed_range)
-        _LOGGER.debug("Fan speed_count: %s", speed_count)
-        return speed_count
+        return self._speed_count
 
     def status_updated(self):
         """Get state of Tuya fan."""
@@ -2,6 +2,7 @@
 import logging
 import textwrap
 from functools import partial
+from types import MappingProxyType
 
 import homeassistant.util.color as color_util
 import voluptuous as vol
@@ -44,50 +45,59 @@ MODE_MUSIC = "music"
 MODE_SCENE = "scene"
 MODE_WHITE = "white"
 
+BRIGHTNESS_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=0, max=10000))
+COLOR_TEMP_KELVIN_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1500, max=8000))
+
 SCENE_CUSTOM = "Custom"
 SCENE_MUSIC = "Music"
 
-SCENE_LIST_RGBW_1000 = {
-    "Night": "000e0d0000000000000000c80000",
-    "Read": "010e0d0000000000000003e801f4",
-    "Meeting": "020e0d0000000000000003e803e8",
-    "Leasure": "030e0d0000000000000001f401f4",
-    "Soft": "04464602007803e803e800000000464602007803e8000a00000000",
-    "Rainbow": "05464601000003e803e800000000464601007803e803e80000000046460100f003e803"
-    + "e800000000",
-    "Shine": "06464601000003e803e800000000464601007803e803e80000000046460100f003e803e8"
-    + "00000000",
-    "Beautiful": "07464602000003e803e800000000464602007803e803e80000000046460200f003e8"
-    + "03e800000000464602003d03e803e80000000046460200ae03e803e800000000464602011303e80"
-    + "3e800000000",
-}
-
-SCENE_LIST_RGBW_255 = {
-    "Night": "bd76000168ffff",
-    "Read": "fffcf70168ffff",
-    "Meeting": "cf38000168ffff",
-    "Leasure": "3855b40168ffff",
-    "Scenario 1": "scene_1",
-    "Scenario 2": "scene_2",
-    "Scenario 3": "scene_3",
-    "Scenario 4": "scene_4",
-}
-
-SCENE_LIST_RGB_1000 = {
-    "Night": "000e0d00002e03e802cc00000000",
-    "Read": "010e0d000084000003e800000000",
-    "Working": "020e0d00001403e803e800000000",
-    "Leisure": "030e0d0000e80383031c00000000",
-    "Soft": "04464602007803e803e800000000464602007803e8000a00000000",
-    "Colorful": "05464601000003e803e800000000464601007803e803e80000000046460100f003e80"
-    + "3e800000000464601003d03e803e80000000046460100ae03e803e800000000464601011303e803"
-    + "e800000000",
-    "Dazzling": "06464601000003e803e800000000464601007803e803e80000000046460100f003e80"
-    + "3e800000000",
-    "Music": "07464602000003e803e800000000464602007803e803e80000000046460200f003e803e8"
-    + "00000000464602003d03e803e80000000046460200ae03e803e800000000464602011303e803e80"
-    + "0000000",
-}
+SCENE_LIST_RGBW_1000 = MappingProxyType(
+    {
+        "Night": "000e0d0000000000000000c80000",
+        "Read": "010e0d0000000000000003e801f4",
+        "Meeting": "020e0d0000000000000003e803e8",
+        "Leasure": "030e0d0000000000000001f401f4",
+        "Soft": "04464602007803e803e800000000464602007803e8000a00000000",
+        "Rainbow": "05464601000003e803e800000000464601007803e803e80000000046460100f003e"
+        + "803e800000000",
+        "Shine": "06464601000003e803e800000000464601007803e803e80000000046460100f003e80"
+        + "3e800000000",
+        "Beautiful": "07464602000003e803e800000000464602007803e803e80000000046460200f00"
+        + "3e803e800000000464602003d03e803e80000000046460200ae03e803e80000000046460201"
+        + "1303e803e800000000",
+    }
+)
+
+SCENE_LIST_RGBW_255 = MappingProxyType(
+    {
+        "Night": "bd76000168ffff",
+        "Read": "fffcf70168ffff",
+        "Meeting": "cf38000168ffff",
+        "Leasure": "3855b40168ffff",
+        "Scenario 1": "scene_1",
+        "Scenario 2": "scene_2",
+        "Scenario 3": "scene_3",
+        "Scenario 4": "scene_4",
+    }
+)
+
+SCENE_LIST_RGB_1000 = MappingProxyType(
+    {
+        "Night": "000e0d00002e03e802cc00000000",
+        "Read": "010e0d000084000003e800000000",
+        "Working": "020e0d00001403e803e800000000",
+        "Leisure": "030e0d0000e80383031c00000000",
+        "Soft": "04464602007803e803e800000000464602007803e8000a00000000",
+        "Colorful": "05464601000003e803e800000000464601007803e803e80000000046460100f003"
+        + "e803e800000000464601003d03e803e80000000046460100ae03e803e800000000464601011"
+        + "303e803e800000000",
+        "Dazzling": "06464601000003e803e800000000464601007803e803e80000000046460100f003"
+        + "e803e800000000",
+        "Music": "07464602000003e803e800000000464602007803e803e80000000046460200f003e80"
+        + "3e800000000464602003d03e803e80000000046460200ae03e803e800000000464602011303"
+        + "e803e800000000",
+    }
+)
 
 
 def map_range(value, from_lower, from_upper, to_lower, to_upper):
@@ -103,20 +113,20 @@ def flow_schema(dps):
     return {
         vol.Optional(CONF_BRIGHTNESS): vol.In(dps),
         vol.Optional(CONF_COLOR_TEMP): vol.In(dps),
-        vol.Optional(CONF_BRIGHTNESS_LOWER, default=DEFAULT_LOWER_BRIGHTNESS): vol.All(
-            vol.Coerce(int), vol.Range(min=0, max=10000)
-        ),
-        vol.Optional(CONF_BRIGHTNESS_UPPER, default=DEFAULT_UPPER_BRIGHTNESS): vol.All(
-            vol.Coerce(int), vol.Range(min=0, max=10000)
-        ),
+        vol.Optional(
+            CONF_BRIGHTNESS_LOWER, default=DEFAULT_LOWER_BRIGHTNESS
+        ): BRIGHTNESS_VALIDATOR,
+        vol.Optional(
+            CONF_BRIGHTNESS_UPPER, default=DEFAULT_UPPER_BRIGHTNESS
+        ): BRIGHTNESS_VALIDATOR,
         vol.Optional(CONF_COLOR_MODE): vol.In(dps),
         vol.Optional(CONF_COLOR): vol.In(dps),
-        vol.Optional(CONF_COLOR_TEMP_MIN_KELVIN, default=DEFAULT_MIN_KELVIN): vol.All(
-            vol.Coerce(int), vol.Range(min=1500, max=8000)
-        ),
-        vol.Optional(CONF_COLOR_TEMP_MAX_KELVIN, default=DEFAULT_MAX_KELVIN): vol.All(
-            vol.Coerce(int), vol.Range(min=1500, max=8000)
-        ),
+        vol.Optional(
+            CONF_COLOR_TEMP_MIN_KELVIN, default=DEFAULT_MIN_KELVIN
+        ): COLOR_TEMP_KELVIN_VALIDATOR,
+        vol.Optional(
+            CONF_COLOR_TEMP_MAX_KELVIN, default=DEFAULT_MAX_KELVIN
+        ): COLOR_TEMP_KELVIN_VALIDATOR,
         vol.Optional(CONF_SCENE): vol.In(dps),
         vol.Optional(
             CONF_MUSIC_MODE, default=False, description={"suggested_value": False}
@@ -139,6 +149,7 @@ class LocaltuyaLight(LocalTuyaEntity, LightEntity):
         self._state = False
         self._brightness = None
         self._color_temp = None
+        self._color_mode = MODE_WHITE
         self._lower_brightness = self._config.get(
             CONF_BRIGHTNESS_LOWER, DEFAULT_LOWER_BRIGHTNESS
         )
@@ -158,6 +169,7 @@ class LocaltuyaLight(LocalTuyaEntity, LightEntity):
         self._effect = None
         self._effect_list = []
         self._scenes = None
+        self._scenes_by_data = {}
         if self.has_config(CONF_SCENE):
             if self._config.get(CONF_SCENE) < 20:
                 self._scenes = SCENE_LIST_RGBW_255
@@ -166,9 +178,20 @@ class LocaltuyaLight(LocalTuyaEntity, LightEntity):
             else:
                 self._scenes = SCENE_LIST_RGBW_1000
             self._effect_list = list(self._scenes.keys())
+            self._scenes_by_data = {data: name for name, data in self._scenes.items()}
         if self._config.get(CONF_MUSIC_MODE):
             self._effect_list.append(SCENE_MUSIC)
 
+        self._supported_features = 0
+        if self.has_config(CONF_BRIGHTNESS):
+            self._supported_features |= SUPPORT_BRIGHTNESS
+        if self.has_config(CONF_COLOR_TEMP):
+            self._supported_features |= SUPPORT_COLOR_TEMP
+        if self.has_config(CONF_COLOR):
+            self._supported_features |= SUPPORT_COLOR | SUPPORT_BRIGHTNESS
+        if self.has_config(CONF_SCENE) or self.has_config(CONF_MUSIC_MODE):
+            self._supported_features |= SUPPORT_EFFECT
+
     @property
     def is_on(self):
         """Check if Tuya light is on."""
@@ -233,56 +256,52 @@ class LocaltuyaLight(LocalTuyaEntity, LightEntity):
     @property
     def supported_features(self):
         """Flag supported features."""
-        supports = 0
-        if self.has_config(CONF_BRIGHTNESS):
-            supports |= SUPPORT_BRIGHTNESS
-        if self.has_config(CONF_COLOR_TEMP):
-            supports |= SUPPORT_COLOR_TEMP
-        if self.has_config(CONF_COLOR):
-            supports |= SUPPORT_COLOR | SUPPORT_BRIGHTNESS
-        if self.has_config(CONF_SCENE) or self.has_config(CONF_MUSIC_MODE):
-            supports |= SUPPORT_EFFECT
-        return supports
+        return self._supported_features
 
     @property
     def is_white_mode(self):
         """Return true if the light is in white mode."""
-        color_mode = self.__get_color_mode()
-        return color_mode is None or color_mode == MODE_WHITE
+        return self._color_mode is None or self._color_mode == MODE_WHITE
 
     @property
     def is_color_mode(self):
         """Return true if the light is in color mode."""
-        color_mode = self.__get_color_mode()
-        return color_mode is not None and color_mode == MODE_COLOR
+        return self._color_mode is not None and self._color_mode == MODE_COLOR
 
     @property
     def is_scene_mode(self):
         """Return true if the light is in scene mode."""
-        color_mode = self.__get_color_mode()
-        return color_mode is not None and color_mode.startswith(MODE_SCENE)
+        return self._color_mode is not None and self._color_mode.startswith(MODE_SCENE)
 
     @property
     def is_music_mode(self):
         """Return true if the light is in music mode."""
-        color_mode = self.__get_color_mode()
-        return color_mode is not None and color_mode == MODE_MUSIC
+        return self._color_mode is not None and self._color_mode == MODE_MUSIC
 
     def __is_color_rgb_encoded(self):
         return len(self.dps_conf(CONF_COLOR)) > 12
 
-    def __find_scene_by_scene_data(self, data):
-        return next(
-            (item for item in self._effect_list if self._scenes.get(item) == data),
-            SCENE_CUSTOM,
+    def __encode_color(self, hs_color, brightness):
+        if self.__is_color_rgb_encoded():
+            rgb = color_util.color_hsv_to_RGB(
+                hs_color[0],
+                hs_color[1],
+                int(brightness * 100 / self._upper_brightness),
+            )
+            return "{:02x}{:02x}{:02x}{:04x}{:02x}{:02x}".format(
+                round(rgb[0]),
+                round(rgb[1]),
+                round(rgb[2]),
+                round(hs_color[0]),
+                round(hs_color[1] * 255 / 100),
+                brightness,
+            )
+        return "{:04x}{:04x}{:04x}".format(
+            round(hs_color[0]), round(hs_color[1] * 10.0), brightness
         )
 
-    def __get_color_mode(self):
-        return (
-            self.dps_conf(CONF_COLOR_MODE)
-            if self.has_config(CONF_COLOR_MODE)
-            else MODE_WHITE
-        )
+    def __find_scene_by_scene_data(self, data):
+        return self._scenes_by_data.get(data, SCENE_CUSTOM)
 
     async def async_turn_on(self, **kwargs):
         """Turn on or control the light."""
@@ -313,25 +332,9 @@ class LocaltuyaLight(LocalTuyaEntity, LightEntity):
             if self.is_white_mode:
                 states[self._config.get(CONF_BRIGHTNESS)] = brightness
             else:
-                if self.__is_color_rgb_encoded():
-                    rgb = color_util.color_hsv_to_RGB(
-                        self._hs[0],
-                        self._hs[1],
-                        int(brightness * 100 / self._upper_brightness),
-                    )
-                    color = "{:02x}{:02x}{:02x}{:04x}{:02x}{:02x}".format(
-                        round(rgb[0]),
-                        round(rgb[1]),
-                        round(rgb[2]),
-                        round(self._hs[0]),
-                        round(self._hs[1] * 255 / 100),
-                        brightness,
-                    )
-                else:
-                    color = "{:04x}{:04x}{:04x}".format(
-                        round(self._hs[0]), round(self._hs[1] * 10.0), brightness
-                    )
-                states[self._config.get(CONF_COLOR)] = color
+                states[self._config.get(CONF_COLOR)] = self.__encode_color(
+                    self._hs, brightness
+                )
                 states[self._config.get(CONF_COLOR_MODE)] = MODE_COLOR
 
         if ATTR_HS_COLOR in kwargs and (features & SUPPORT_COLOR):
@@ -342,23 +345,9 @@ class LocaltuyaLight(LocalTuyaEntity, LightEntity):
                 states[self._config.get(CONF_BRIGHTNESS)] = brightness
                 states[self._config.get(CONF_COLOR_MODE)] = MODE_WHITE
             else:
-                if self.__is_color_rgb_encoded():
-                    rgb = color_util.color_hsv_to_RGB(
-                        hs[0], hs[1], int(brightness * 100 / self._upper_brightness)
-                    )
-                    color = "{:02x}{:02x}{:02x}{:04x}{:02x}{:02x}".format(
-                        round(rgb[0]),
-                        round(rgb[1]),
-                        round(rgb[2]),
-                        round(hs[0]),
-                        round(hs[1] * 255 / 100),
-                        brightness,
-                    )
-                else:
-                    color = "{:04x}{:04x}{:04x}".format(
-                        round(hs[0]), round(hs[1] * 10.0), brightness
-                    )
-                states[self._config.get(CONF_COLOR)] = color
+                states[self._config.get(CONF_COLOR)] = self.__encode_color(
+                    hs, brightness
+                )
                 states[self._config.get(CONF_COLOR_MODE)] = MODE_COLOR
 
         if ATTR_COLOR_TEMP in kwargs and (features & SUPPORT_COLOR_TEMP):
@@ -383,6 +372,8 @@ class LocaltuyaLight(LocalTuyaEntity, LightEntity):
         self._state = self.dps(self._dp_id)
         supported = self.supported_features
         self._effect = None
+        if self.has_config(CONF_COLOR_MODE):
+            self._color_mode = self.dps_conf(CONF_COLOR_MODE)
         if supported & SUPPORT_BRIGHTNESS and self.has_config(CONF_BRIGHTNESS):
             self._brightness = self.dps_conf(CONF_BRIGHTNESS)
 
@@ -406,10 +397,8 @@ class LocaltuyaLight(LocalTuyaEntity, LightEntity):
             self._color_temp = self.dps_conf(CONF_COLOR_TEMP)
 
         if self.is_scene_mode and supported & SUPPORT_EFFECT:
-            if self.dps_conf(CONF_COLOR_MODE) != MODE_SCENE:
-                self._effect = self.__find_scene_by_scene_data(
-                    self.dps_conf(CONF_COLOR_MODE)
-                )
+            if self._color_mode != MODE_SCENE:
+                self._effect = self.__find_scene_by_scene_data(self._color_mode)
             else:
                 self._effect = self.__find_scene_by_scene_data(
                     self.dps_conf(CONF_SCENE)
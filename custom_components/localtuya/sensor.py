@@ -42,6 +42,9 @@ class LocaltuyaSensor(LocalTuyaEntity):
         """Initialize the Tuya sensor."""
         super().__init__(device, config_entry, sensorid, _LOGGER, **kwargs)
         self._state = STATE_UNKNOWN
+        self._scale_factor = None
+        if self._config.get(CONF_SCALING) is not None:
+            self._scale_factor = float(self._config[CONF_SCALING])
 
     @property
     def state(self):
@@ -61,7 +64,7 @@ class LocaltuyaSensor(LocalTuyaEntity):
     def status_updated(self):
         """Device status was updated."""
         state = self.dps(self._dp_id)
-        scale_factor = self._config.get(CONF_SCALING)
+        scale_factor = self._scale_factor
         if scale_factor is not None and isinstance(state, (int, float)):
             state = round(state * scale_factor, DEFAULT_PRECISION)
         self._state = state
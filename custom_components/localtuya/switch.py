@@ -40,7 +40,8 @@ class LocaltuyaSwitch(LocalTuyaEntity, SwitchEntity):
         """Initialize the Tuya switch."""
         super().__init__(device, config_entry, switchid, _LOGGER, **kwargs)
         self._state = None
-        print("Initialized switch [{}]".format(self.name))
+        self._attrs = {}
+        self.debug("Initialized switch [%s]", self.name)
 
     @property
     def is_on(self):
@@ -50,16 +51,7 @@ class LocaltuyaSwitch(LocalTuyaEntity, SwitchEntity):
     @property
     def device_state_attributes(self):
         """Return device state attributes."""
-        attrs = {}
-        if self.has_config(CONF_CURRENT):
-            attrs[ATTR_CURRENT] = self.dps(self._config[CONF_CURRENT])
-        if self.has_config(CONF_CURRENT_CONSUMPTION):
-            attrs[ATTR_CURRENT_CONSUMPTION] = (
-                self.dps(self._config[CONF_CURRENT_CONSUMPTION]) / 10
-            )
-        if self.has_config(CONF_VOLTAGE):
-            attrs[ATTR_VOLTAGE] = self.dps(self._config[CONF_VOLTAGE]) / 10
-        return attrs
+        return self._attrs
 
     async def async_turn_on(self, **kwargs):
         """Turn Tuya switch on."""
@@ -73,5 +65,16 @@ class LocaltuyaSwitch(LocalTuyaEntity, SwitchEntity):
         """Device status was updated."""
         self._state = self.dps(self._dp_id)
 
+        attrs = {}
+        if self.has_config(CONF_CURRENT):
+            attrs[ATTR_CURRENT] = self.dps_conf(CONF_CURRENT)
+        if self.has_config(CONF_CURRENT_CONSUMPTION):
+            value = self.dps_conf(CONF_CURRENT_CONSUMPTION)
+            attrs[ATTR_CURRENT_CONSUMPTION] = value / 10 if value is not None else None
+        if self.has_config(CONF_VOLTAGE):
+            value = self.dps_conf(CONF_VOLTAGE)
+            attrs[ATTR_VOLTAGE] = value / 10 if value is not None else None
+        self._attrs = attrs
+
 
 async_setup_entry = partial(async_setup_entry, DOMAIN, LocaltuyaSwitch, flow_schema)
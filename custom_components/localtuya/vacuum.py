@@ -99,18 +99,22 @@ class LocaltuyaVacuum(LocalTuyaEntity, StateVacuumEntity):
         self._battery_level = None
         self._attrs = {}
 
-        self._idle_status_list = []
+        self._idle_statuses = frozenset()
         if self.has_config(CONF_IDLE_STATUS_VALUE):
-            self._idle_status_list = self._config[CONF_IDLE_STATUS_VALUE].split(",")
+            self._idle_statuses = frozenset(
+                self._config[CONF_IDLE_STATUS_VALUE].split(",")
+            )
 
         self._modes_list = []
         if self.has_config(CONF_MODES):
             self._modes_list = self._config[CONF_MODES].split(",")
             self._attrs[MODES_LIST] = self._modes_list
 
-        self._docked_status_list = []
+        self._docked_statuses = frozenset()
         if self.has_config(CONF_DOCKED_STATUS_VALUE):
-            self._docked_status_list = self._config[CONF_DOCKED_STATUS_VALUE].split(",")
+            self._docked_statuses = frozenset(
+                self._config[CONF_DOCKED_STATUS_VALUE].split(",")
+            )
 
         self._fan_speed_list = []
         if self.has_config(CONF_FAN_SPEEDS):
@@ -119,29 +123,28 @@ class LocaltuyaVacuum(LocalTuyaEntity, StateVacuumEntity):
         self._fan_speed = ""
         self._cleaning_mode = ""
 
-        print("Initialized vacuum [{}]".format(self.name))
-
-    @property
-    def supported_features(self):
-        """Flag supported features."""
-        supported_features = (
+        self._supported_features = (
             SUPPORT_START
             | SUPPORT_PAUSE
             | SUPPORT_STOP
             | SUPPORT_STATUS
             | SUPPORT_STATE
         )
-
         if self.has_config(CONF_RETURN_MODE):
-            supported_features = supported_features | SUPPORT_RETURN_HOME
+            self._supported_features |= SUPPORT_RETURN_HOME
         if self.has_config(CONF_FAN_SPEED_DP):
-            supported_features = supported_features | SUPPORT_FAN_SPEED
+            self._supported_features |= SUPPORT_FAN_SPEED
         if self.has_config(CONF_BATTERY_DP):
-            supported_features = supported_features | SUPPORT_BATTERY
+            self._supported_features |= SUPPORT_BATTERY
         if self.has_config(CONF_LOCATE_DP):
-            supported_features = supported_features | SUPPORT_LOCATE
+            self._supported_features |= SUPPORT_LOCATE
+
+        self.debug("Initialized vacuum [%s]", self.name)
 
-        return supported_features
+    @property
+    def supported_features(self):
+        """Flag supported features."""
+        return self._supported_features
 
     @property
     def state(self):
@@ -217,9 +220,9 @@ class LocaltuyaVacuum(LocalTuyaEntity, StateVacuumEntity):
         """Device status was updated."""
         state_value = str(self.dps(self._dp_id))
 
-        if state_value in self._idle_status_list:
+        if state_value in self._idle_statuses:
             self._state = STATE_IDLE
-        elif state_value in self._docked_status_list:
+        elif state_value in self._docked_statuses:
             self._state = STATE_DOCKED
         elif state_value == self._config[CONF_RETURNING_STATUS_VALUE]:
             self._state = STATE_RETURNING